@@ -1,6 +1,6 @@
 
 import numpy as np
-from astropy.time import Time, TimeDelta
+from astropy.time import Time
 import rubin_scheduler.site_models as site_models
 
 
@@ -71,6 +71,54 @@ def rotator_movement(percent=100):
     return rot
 
 
+def _make_data_kernel(sunsets, probs, first_night, event_probs, event_lengths):
+    """Pick the nights which start a multi-night unscheduled downtime.
+
+    Parameters
+    ----------
+    sunsets : `np.ndarray`, (N,)
+        Sunset (in mjd `float` format) for each night.
+    probs : `np.ndarray`, (N,)
+        Random value in [0, 1) drawn for each night.
+    first_night : `int`
+        Index of the first night which can start an event.
+    event_probs : `np.ndarray`, (M,)
+        Probability of each event type, in increasing order.
+    event_lengths : `np.ndarray`, (M,)
+        Length (in nights) of each event type.
+
+    Returns
+    -------
+    start_mjds : `np.ndarray`, (K,)
+        Start of each event (mjd).
+    end_mjds : `np.ndarray`, (K,)
+        End of each event (mjd).
+    codes : `np.ndarray`, (K,)
+        Index of the event type for each event.
+    """
+    # At most one event per night, so fill arrays of that size
+    # and trim to the number of events at the end
+    n_nights = len(sunsets)
+    start_mjds = np.empty(n_nights)
+    end_mjds = np.empty(n_nights)
+    codes = np.empty(n_nights, dtype=np.int8)
+    n_events = 0
+    # Nights before skip_until are already covered by an event
+    skip_until = -1
+    for night in range(first_night, n_nights):
+        if night < skip_until:
+            continue
+        for code in range(len(event_probs)):
+            if probs[night] < event_probs[code]:
+                start_mjds[n_events] = sunsets[night]
+                end_mjds[n_events] = sunsets[night] + event_lengths[code]
+                codes[n_events] = code
+                n_events += 1
+                skip_until = night + event_lengths[code]
+                break
+    return start_mjds[:n_events], end_mjds[:n_events], codes[:n_events]
+
+
 class UnscheduledDowntimeDataYearOne:
     """Handle (and create) the unscheduled downtime information.
 
@@ -121,14 +169,18 @@ class UnscheduledDowntimeDataYearOne:
         downtime : `np.ndarray`
             The array of all unscheduled downtimes, with keys for
             'start', 'end', 'activity',  corresponding to
-            `astropy.time.Time`, `astropy.time.Time`, and `str`.
+            MJD `float`, MJD `float`, and `str`.
         """
         return self.downtime
 
     def _downtime_status(self, time):
-        """Look behind the scenes at the downtime status/next values"""
-        next_start = self.downtime["start"].searchsorted(time, side="right")
-        next_end = self.downtime["end"].searchsorted(time, side="right")
+        """Look behind the scenes at the downtime status/next values
+
+        ``time`` may be an `astropy.time.Time` or an mjd `float`.
+        """
+        mjd = time.mjd if hasattr(time, "mjd") else float(time)
+        next_start = np.searchsorted(self._starts_mjd, mjd, side="right")
+        next_end = np.searchsorted(self._ends_mjd, mjd, side="right")
         if next_start > next_end:
             current = self.downtime[next_end]
         else:
@@ -154,89 +206,73 @@ class UnscheduledDowntimeDataYearOne:
         """
         self.rng = np.random.default_rng(seed=self.seed)
 
-        starts = []
-        ends = []
-        acts = []
-
         end_of_start = 380
-        
-        night_counted = np.zeros(len(self.sunsets))
-        
-        for night, (sunset, sunrise) in enumerate(zip(self.sunsets, self.sunrises)):
-            prob = self.rng.random()
-            hours_in_night = (sunrise - sunset) * 24.0
-            if night_counted[night] == 1:
-                continue
-                
-            if night < end_of_start:
-                # Estimate a threshold probability of having some downtime - 
-                # 50% at start, dropping until end_of_start, where it should be .. 5%?
-                nightly_threshold = 0.5 * (1 - night / (end_of_start + 45))
-                if prob <= nightly_threshold:
-                    # Generate an estimate of how long the downtime should be
-                    #prob_time = self.rng.uniform(low=1, high=hours_in_night, size=1)[0] 
-                    prob_time = self.rng.gumbel(loc=1, scale=6, size=1)[0]
-                    if prob_time >= hours_in_night:
-                        prob_time = hours_in_night
-                    if prob_time <= 1:
-                        prob_time = 1.0
-                    # And generate a starting time during the night for this event
-                    tmax = hours_in_night - prob_time
-                    if tmax <= 0:
-                        starts.append(Time(sunset, format='mjd', scale='utc'))
-                        ends.append(Time(sunrise, format='mjd', scale='utc'))
-                        acts.append("Year1 Eng")
-                    else:
-                        offset = self.rng.uniform(low=sunset, high=sunset + tmax / 24.0)
-                        starts.append(Time(offset, format='mjd', scale='utc'))
-                        ends.append(Time(offset + prob_time/24.0, format='mjd', scale='utc'))
-                        acts.append("Year1 Eng")
-                night_counted[night] = 1
-                continue
-            # And also add the standard unscheduled downtime  
-            start_time = Time(sunset, format='mjd', scale='utc')
-            if prob < self.CATASTROPHIC_EVENT["P"]:
-                starts.append(start_time)
-                end_night = start_time + TimeDelta(self.CATASTROPHIC_EVENT["length"], format="jd")
-                ends.append(end_night)
-                acts.append(self.CATASTROPHIC_EVENT["level"])
-                night_counted[night:night + self.CATASTROPHIC_EVENT["length"]] = 1
-            elif prob < self.MAJOR_EVENT["P"]:                    
-                starts.append(start_time)
-                end_night = start_time + TimeDelta(self.MAJOR_EVENT["length"], format="jd")
-                ends.append(end_night)
-                acts.append(self.MAJOR_EVENT["level"])
-                night_counted[night:night + self.MAJOR_EVENT["length"]] = 1
-            elif prob < self.INTERMEDIATE_EVENT["P"]:
-                starts.append(start_time)
-                end_night = start_time + TimeDelta(self.INTERMEDIATE_EVENT["length"], format="jd")
-                ends.append(end_night)
-                acts.append(self.INTERMEDIATE_EVENT["level"])
-                night_counted[night:night + self.INTERMEDIATE_EVENT["length"]] = 1
-            elif prob < self.MINOR_EVENT["P"]:
-                starts.append(start_time)
-                end_night = start_time + TimeDelta(self.MINOR_EVENT["length"], format="jd")
-                ends.append(end_night)
-                acts.append(self.MINOR_EVENT["level"])
-                night_counted[night:night + self.MINOR_EVENT["length"]] = 1
-        
-        self.downtime = np.array(
-            list(zip(starts, ends, acts)),
-            dtype=[("start", "O"), ("end", "O"), ("activity", "O")],
+
+        n_nights = len(self.sunsets)
+
+        # Draw all of the random values up front, rather than per night
+        probs = self.rng.random(n_nights)
+        gumbels = self.rng.gumbel(loc=1, scale=6, size=n_nights)
+        uniforms = self.rng.uniform(size=n_nights)
+
+        # Estimate a threshold probability of having some downtime -
+        # 50% at start, dropping until end_of_start, where it should be .. 5%?
+        nights = np.arange(n_nights)
+        early = nights < end_of_start
+        nightly_threshold = np.where(early, 0.5 * (1 - nights / (end_of_start + 45)), 0.0)
+        year1_down = early & (probs <= nightly_threshold)
+
+        # Generate an estimate of how long the downtime should be,
+        # and a starting time during the night for this event
+        hours_in_night = (self.sunrises - self.sunsets) * 24.0
+        prob_time = np.maximum(np.minimum(gumbels, hours_in_night), 1.0)
+        tmax = hours_in_night - prob_time
+        offset = self.sunsets + uniforms * np.maximum(tmax, 0) / 24.0
+        year1_starts = np.where(tmax > 0, offset, self.sunsets)[year1_down]
+        year1_ends = np.where(tmax > 0, offset + prob_time / 24.0, self.sunrises)[year1_down]
+
+        # And also add the standard unscheduled downtime
+        events = [self.CATASTROPHIC_EVENT, self.MAJOR_EVENT, self.INTERMEDIATE_EVENT, self.MINOR_EVENT]
+        event_starts, event_ends, event_codes = _make_data_kernel(
+            self.sunsets,
+            probs,
+            end_of_start,
+            np.array([event["P"] for event in events]),
+            np.array([event["length"] for event in events]),
+        )
+        event_levels = np.array([event["level"] for event in events])
+
+        self.downtime = np.empty(
+            year1_starts.size + event_starts.size,
+            dtype=[("start", "f8"), ("end", "f8"), ("activity", "U24")],
         )
+        self.downtime["start"] = np.concatenate([year1_starts, event_starts])
+        self.downtime["end"] = np.concatenate([year1_ends, event_ends])
+        self.downtime["activity"][: year1_starts.size] = "Year1 Eng"
+        self.downtime["activity"][year1_starts.size :] = event_levels[event_codes]
+        self._starts_mjd = self.downtime["start"]
+        self._ends_mjd = self.downtime["end"]
 
     def total_downtime(self):
         """Return total downtime (in days).
 
         Returns
         -------
-        total : `int`
+        total : `float`
             Total number of downtime days.
         """
-        total = 0
-        for td in self.downtime["end"] - self.downtime["start"]:
-            total += td.jd
-        return total
+        return float(np.sum(self.downtime["end"] - self.downtime["start"]))
+
+
+def _to_mjd_pair(downtimes):
+    """Return the 'start' and 'end' columns of a downtime array as mjd.
+
+    Columns of `astropy.time.Time` objects are converted with one
+    vectorized ``.mjd`` call each, `float` columns are returned as-is.
+    """
+    if downtimes.dtype["start"].kind == "f":
+        return downtimes["start"], downtimes["end"]
+    return Time(downtimes["start"]).mjd, Time(downtimes["end"]).mjd
 
 
 def new_downtimes(mjd_start=None, seed=42):
@@ -256,37 +292,27 @@ def new_downtimes(mjd_start=None, seed=42):
     reg_dt = site_models.UnscheduledDowntimeData(mjd_start_time, seed=seed)
     regular_downtimes = reg_dt()
 
-    down_starts = []
-    down_ends = []
-
-    for dt in unscheduled_downtimes:
-        down_starts.append(dt["start"].mjd)
-        down_ends.append(dt["end"].mjd)
-
-    for dt in regular_downtimes:
-        down_starts.append(dt["start"].mjd)
-        down_ends.append(dt["end"].mjd)
-
+    unsched_starts, unsched_ends = _to_mjd_pair(unscheduled_downtimes)
+    reg_starts, reg_ends = _to_mjd_pair(regular_downtimes)
+    down_starts = np.concatenate([unsched_starts, reg_starts])
+    down_ends = np.concatenate([unsched_ends, reg_ends])
 
-    downtimes = np.array(
-        list(zip(down_starts, down_ends)),
-        dtype=list(zip(["start", "end"], [float, float])),
-    )
+    downtimes = np.empty(down_starts.size, dtype=[("start", float), ("end", float)])
+    downtimes["start"] = down_starts
+    downtimes["end"] = down_ends
     downtimes.sort(order="start")
 
-    # Make sure there aren't any overlapping downtimes
-    diff = downtimes["start"][1:] - downtimes["end"][0:-1]
-    while np.min(diff) < 0:
-        # Should be able to do this without a loop, but this works
-        for i, dt in enumerate(downtimes[0:-1]):
-            if downtimes["start"][i + 1] < dt["end"]:
-                new_end = np.max([dt["end"], downtimes["end"][i + 1]])
-                downtimes[i]["end"] = new_end
-                downtimes[i + 1]["end"] = new_end
-
-        good = np.where(downtimes["end"] - np.roll(downtimes["end"], 1) != 0)
-        downtimes = downtimes[good]
-        diff = downtimes["start"][1:] - downtimes["end"][0:-1]
+    # Make sure there aren't any overlapping downtimes.
+    # A downtime starts a new block if it begins after every earlier
+    # downtime has ended, then each block is collapsed to its first
+    # start and latest end.
+    run_end = np.maximum.accumulate(downtimes["end"])
+    new_block = np.ones(downtimes.size, dtype=bool)
+    new_block[1:] = downtimes["start"][1:] >= run_end[:-1]
+    first = np.flatnonzero(new_block)
+    block_ends = np.maximum.reduceat(downtimes["end"], first)
+    downtimes = downtimes[first]
+    downtimes["end"] = block_ends
 
     return downtimes
 